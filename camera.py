@@ -0,0 +1,31 @@
+import time
+
+try:
+    from picamera2 import Picamera2
+    PICAMERA_AVAILABLE = True
+except ImportError:
+    Picamera2 = None
+    PICAMERA_AVAILABLE = False
+
+# Captured requests waiting to be saved each hold a camera buffer
+SAVE_QUEUE_DEPTH = 2
+
+# libcamera's AeStateConverged; newer releases report AeState in place of AeLocked
+AE_STATE_CONVERGED = 2
+
+
+def wait_for_exposure(camera, timeout=2.0):
+    # Return as soon as auto exposure reports it has converged instead of
+    # sleeping for a fixed time; the timeout covers sensors that never lock.
+    # capture_metadata() blocks until the next frame arrives, so the loop is
+    # paced by the frame rate and needs no sleep of its own.
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        metadata = camera.capture_metadata()
+        if metadata.get("AeLocked") or metadata.get("AeState") == AE_STATE_CONVERGED:
+            return True
+    return False
+
+
+def photo_filename(session_count):
+    return f"photo_{time.strftime('%Y%m%d_%H%M%S')}_{session_count:03d}.jpg"
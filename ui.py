@@ -0,0 +1,333 @@
+import os
+import queue
+import threading
+from collections import deque
+from pathlib import Path
+from dataclasses import dataclass
+from typing import Optional
+
+from rich.table import Table
+from rich.text import Text
+from textual.app import App
+from textual.widgets import Static
+from textual.containers import Container
+
+from camera import PICAMERA_AVAILABLE, Picamera2, SAVE_QUEUE_DEPTH, photo_filename, wait_for_exposure
+
+
+@dataclass
+class Model:
+    camera: Optional[object] = None
+    camera_ready: bool = False
+    camera_status: str = "Initializing..."
+    session_count: int = 0
+    total_count: int = 0
+    last_photo: str = "None"
+    recent_photos: deque = None
+    output_dir: Path = Path("photos")
+    is_capturing: bool = False
+    pending_saves: int = 0
+    
+    def __post_init__(self):
+        if self.recent_photos is None:
+            self.recent_photos = deque(maxlen=5)
+
+
+class PicamUI(App):
+    CSS = """
+    Screen {
+        background: #1e1e1e;
+    }
+    
+    .header {
+        height: 3;
+        text-align: center;
+        background: #2d2d2d;
+        color: #87ceeb;
+    }
+    
+    .content {
+        padding: 1;
+    }
+    
+    .panel {
+        height: 15;
+    }
+    
+    .controls {
+        height: 2;
+        text-align: center;
+        background: #2d2d2d;
+    }
+    """
+    
+    # Fixed panel rows are built once; plain str cells would be run through
+    # the markup parser again on every update
+    CAPTURING_TEXT = Text("📸 CAPTURING...")
+    READY_TEXT = Text("🎯 READY")
+    INITIALIZING_TEXT = Text("⏳ INITIALIZING")
+    NO_PHOTOS_TEXT = Text("📸 Recent Photos:\n  No photos yet...")
+    
+    def __init__(self, output_dir="photos"):
+        super().__init__()
+        self.model = Model(output_dir=Path(output_dir))
+        self.model.output_dir.mkdir(exist_ok=True)
+        self._stats_cache = {"dir_mtime": None, "count": 0, "last": "None"}
+        self._displayed = None
+        self._exit_requested = False
+        self.save_depth = SAVE_QUEUE_DEPTH
+        self.save_q = queue.Queue(maxsize=SAVE_QUEUE_DEPTH)
+        threading.Thread(target=self._saver, daemon=True).start()
+        
+    def compose(self):
+        self._panel_widget = Static("", id="panel", classes="panel")
+        yield Container(
+            Static("📷 picam-ui", classes="header"),
+            Container(
+                self._panel_widget,
+                classes="content"
+            ),
+            Static("SPACE - Capture | R - Refresh | Q - Quit", classes="controls")
+        )
+    
+    def on_mount(self):
+        self.init_camera()
+        # Pick up photos written by other processes without waiting for a key
+        self.set_interval(0.5, self.refresh_stats)
+    
+    def refresh_stats(self):
+        # Counts are being updated in place while saves are in flight, and a
+        # scan now could count a file before capture_done adds it again
+        if self.model.pending_saves:
+            return
+        
+        self.update_stats()
+        self.update_display()
+        
+    def init_camera(self):
+        try:
+            self.model.camera_status = "Detecting camera..."
+            self.update_display()
+            
+            if not PICAMERA_AVAILABLE:
+                self.model.camera_status = "❌ picamera2 not found!"
+                self.update_display()
+                return False
+            
+            self.model.camera_status = "Initializing picamera2..."
+            self.update_display()
+            self.model.camera = Picamera2()
+            
+            self.model.camera_status = "Configuring camera..."
+            self.update_display()
+            # One spare buffer beyond the queued requests keeps the sensor streaming
+            try:
+                config = self.model.camera.create_still_configuration(buffer_count=SAVE_QUEUE_DEPTH + 1)
+                self.model.camera.configure(config)
+            except Exception:
+                # Full-resolution buffers are large and low-memory boards (Pi
+                # Zero) may not fit the extras; fall back to the default single
+                # buffer with one save in flight
+                self.save_depth = 1
+                self.model.camera.configure(self.model.camera.create_still_configuration())
+            
+            self.model.camera_status = "Starting camera..."
+            self.update_display()
+            self.model.camera.start()
+            wait_for_exposure(self.model.camera)
+            
+            self.model.camera_ready = True
+            self.model.camera_status = "✅ Ready"
+            self.update_stats()
+            self.update_display()
+            return True
+            
+        except Exception as e:
+            self.model.camera_status = f"❌ Error: {str(e)}"
+            self.update_display()
+            return False
+    
+    def update_stats(self):
+        cache = self._stats_cache
+        try:
+            dir_mtime = os.stat(self.model.output_dir).st_mtime_ns
+            
+            # The directory mtime only moves when entries are added or removed,
+            # so the scan can be skipped while it is unchanged
+            if dir_mtime != cache["dir_mtime"]:
+                latest_name, latest_mtime, count = "None", -1, 0
+                with os.scandir(self.model.output_dir) as entries:
+                    for entry in entries:
+                        if not entry.name.endswith(".jpg"):
+                            continue
+                        count += 1
+                        mtime = entry.stat().st_mtime
+                        if mtime > latest_mtime:
+                            latest_mtime, latest_name = mtime, entry.name
+                cache["count"] = count
+                cache["last"] = latest_name
+                cache["dir_mtime"] = dir_mtime
+        except OSError:
+            # Missing or unreadable directory; rescan once it is usable again
+            cache["dir_mtime"] = None
+            cache["count"] = 0
+            cache["last"] = "None"
+        
+        self.model.total_count = cache["count"]
+        self.model.last_photo = cache["last"]
+    
+    def capture_photo(self):
+        if not self.model.camera_ready or self.model.pending_saves >= self.save_depth:
+            return False
+        
+        try:
+            request = self.model.camera.capture_request()
+        except Exception as e:
+            self.notify(f"❌ Capture failed: {e}")
+            return False
+        
+        self.model.session_count += 1
+        filename = photo_filename(self.model.session_count)
+        filepath = self.model.output_dir / filename
+        
+        # JPEG encoding and the disk write happen on the saver thread, so the
+        # sensor can expose the next frame while this one is being saved
+        self.model.pending_saves += 1
+        self.model.is_capturing = True
+        self.save_q.put_nowait((request, str(filepath), filename))
+        return True
+    
+    def _saver(self):
+        while True:
+            request, filepath, filename = self.save_q.get()
+            try:
+                error = None
+                try:
+                    request.save("main", filepath)
+                except Exception as e:
+                    error = e
+                # Hand the buffer back before the UI may queue another capture;
+                # a failure here must not kill the thread or leave the save pending
+                try:
+                    request.release()
+                except Exception as e:
+                    if error is None:
+                        error = e
+                
+                # Nobody is left to report to once the app has stopped
+                if self.is_running:
+                    try:
+                        if error is not None:
+                            self.call_from_thread(self.capture_failed, error)
+                        else:
+                            self.call_from_thread(self.capture_done, filename)
+                    except RuntimeError:
+                        pass
+            finally:
+                self.save_q.task_done()
+    
+    def capture_done(self, filename):
+        self.model.recent_photos.append(filename)
+        
+        # Show the new photo straight away; dir_mtime is left alone so the
+        # next refresh still rescans once and picks up any other changes made
+        # while the save was running
+        cache = self._stats_cache
+        cache["count"] += 1
+        cache["last"] = filename
+        self.model.total_count = cache["count"]
+        self.model.last_photo = cache["last"]
+        
+        self.save_finished()
+    
+    def capture_failed(self, error):
+        self.notify(f"❌ Capture failed: {error}")
+        self.save_finished()
+    
+    def save_finished(self):
+        self.model.pending_saves -= 1
+        self.model.is_capturing = self.model.pending_saves > 0
+        if self._exit_requested and not self.model.pending_saves:
+            self.exit()
+            return
+        self.update_display()
+    
+    def request_exit(self):
+        # Quitting while saves are in flight would lose those photos, so
+        # defer the exit until the saver has finished them
+        if self.model.pending_saves:
+            self._exit_requested = True
+            self.model.camera_status = "Saving photos before quitting..."
+            self.update_display()
+            return
+        self.exit()
+    
+    async def action_quit(self):
+        self.request_exit()
+    
+    def update_display(self):
+        # Only rebuild and repaint the panel when something shown on it changed
+        state = (
+            self.model.camera_ready,
+            self.model.camera_status,
+            self.model.session_count,
+            self.model.total_count,
+            self.model.last_photo,
+            self.model.is_capturing,
+            tuple(self.model.recent_photos),
+        )
+        if state == self._displayed:
+            return
+        self._displayed = state
+        
+        status_icon = "🟢" if self.model.camera_ready else "🔴"
+        
+        # Status
+        status_text = f"{status_icon} {self.model.camera_status}"
+        
+        # Stats
+        stats_text = f"📊 Session: {self.model.session_count}  Total: {self.model.total_count}\n📁 Last: {self.model.last_photo}"
+        
+        # Ready status
+        if self.model.is_capturing:
+            ready_text = self.CAPTURING_TEXT
+        else:
+            ready_text = self.READY_TEXT if self.model.camera_ready else self.INITIALIZING_TEXT
+        
+        # Recent photos
+        if self.model.recent_photos:
+            photo_lines = [f"  • {photo}" for photo in self.model.recent_photos]
+            photos_text = Text("\n".join(["📸 Recent Photos:", *photo_lines]))
+        else:
+            photos_text = self.NO_PHOTOS_TEXT
+        
+        # Everything goes into one Static so an update is a single repaint
+        table = Table.grid(padding=(0, 0, 1, 0))
+        for text in (Text(status_text), Text(stats_text), ready_text, photos_text):
+            table.add_row(text)
+        self._panel_widget.update(table)
+    
+    def on_key(self, event):
+        if event.key == "q":
+            self.request_exit()
+            return
+        elif event.key == "space":
+            self.capture_photo()
+        elif event.key == "r":
+            # An explicit refresh always rescans, whatever the cache says
+            self._stats_cache["dir_mtime"] = None
+            self.refresh_stats()
+        else:
+            return
+        # Actions only mutate the model; repaint once per handled key
+        self.update_display()
+    
+    def shutdown(self):
+        # Called once run() has returned: wait for any queued photos to be
+        # written before the camera goes away
+        self.save_q.join()
+        if self.model.camera:
+            try:
+                self.model.camera.stop()
+            except:
+                pass